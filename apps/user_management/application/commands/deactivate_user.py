@@ -32,10 +32,3 @@ class DeactivateUserCommand:
     def __str__(self) -> str:
         """Return string representation."""
         return f"DeactivateUserCommand(user_id={self.user_id})"
-    
-    def __repr__(self) -> str:
-        """Return detailed string representation."""
-        return (
-            f"DeactivateUserCommand(user_id='{self.user_id}', "
-            f"reason={self.reason!r})"
-        )
\ No newline at end of file
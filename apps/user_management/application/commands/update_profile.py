@@ -64,11 +64,3 @@ class UpdateProfileCommand:
             updates.append("last_name")
         
         return f"UpdateProfileCommand(user_id={self.user_id}, updates={updates})"
-    
-    def __repr__(self) -> str:
-        """Return detailed string representation."""
-        return (
-            f"UpdateProfileCommand(user_id='{self.user_id}', "
-            f"new_email={self.new_email!r}, new_first_name={self.new_first_name!r}, "
-            f"new_last_name={self.new_last_name!r})"
-        )
\ No newline at end of file
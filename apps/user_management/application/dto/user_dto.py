@@ -8,7 +8,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
+
+if TYPE_CHECKING:
+    from ...domain.entities.user import User
+
+# Python 3.11+ fromisoformat accepts a trailing 'Z' directly
+_parse_datetime = datetime.fromisoformat
 
 
 @dataclass(frozen=True, slots=True)
@@ -55,6 +61,32 @@ class UserDTO:
             'updated_at': self.updated_at.isoformat()
         }
     
+    @classmethod
+    def from_entity(cls, user: User) -> UserDTO:
+        """Create DTO from a User domain entity.
+        
+        Each value object is unwrapped once and reused for the
+        computed full name.
+        
+        Args:
+            user: User domain entity.
+            
+        Returns:
+            UserDTO instance.
+        """
+        first_name = user.first_name.value
+        last_name = user.last_name.value
+        return cls(
+            id=str(user.id),
+            email=user.email.value,
+            first_name=first_name,
+            last_name=last_name,
+            full_name=f"{first_name} {last_name}",
+            status=user.status.value,
+            created_at=user.created_at,
+            updated_at=user.updated_at
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> UserDTO:
         """Create DTO from dictionary representation.
@@ -67,11 +99,11 @@ class UserDTO:
         """
         created_at = data['created_at']
         if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+            created_at = _parse_datetime(created_at)
             
         updated_at = data['updated_at']
         if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
+            updated_at = _parse_datetime(updated_at)
         
         return cls(
             id=data['id'],
@@ -4,7 +4,8 @@ This module contains application-specific exceptions that translate
 domain errors and provide appropriate error handling for the application layer.
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Type
 
 from ..domain.errors import (
     UserManagementDomainError,
@@ -15,6 +16,9 @@ from ..domain.errors import (
     UserDeactivatedError as DomainUserDeactivatedError
 )
 
+# Shared read-only details for errors raised without any
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
 
 class ApplicationError(Exception):
     """Base exception for all application-level errors.
@@ -38,7 +42,7 @@ class ApplicationError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details: Mapping[str, Any] = details if details else _EMPTY_DETAILS
         self.cause = cause
 
 
@@ -169,6 +173,84 @@ class UserNotFoundError(ApplicationError):
         self.identifier = identifier
 
 
+def _translate_user_already_exists(
+    domain_error: DomainUserAlreadyExistsError
+) -> ApplicationError:
+    return RegistrationFailedError(
+        reason="Email address is already registered",
+        details={'email': domain_error.email},
+        cause=domain_error
+    )
+
+
+def _translate_user_not_found(domain_error: DomainUserNotFoundError) -> ApplicationError:
+    return UserNotFoundError(
+        identifier=domain_error.identifier,
+        cause=domain_error
+    )
+
+
+def _translate_invalid_credentials(
+    domain_error: DomainInvalidCredentialsError
+) -> ApplicationError:
+    return AuthenticationFailedError(
+        reason="Invalid email or password",
+        details={'email': domain_error.email},
+        cause=domain_error
+    )
+
+
+def _translate_user_deactivated(domain_error: DomainUserDeactivatedError) -> ApplicationError:
+    return AuthenticationFailedError(
+        reason="Account is deactivated",
+        details={'user_identifier': domain_error.user_identifier},
+        cause=domain_error
+    )
+
+
+# Application error raised for a failed operation, keyed by operation name
+_OPERATION_ERRORS: Dict[str, Type[ApplicationError]] = {
+    'update_profile': ProfileUpdateFailedError,
+    'change_password': PasswordChangeFailedError,
+    'deactivate': UserDeactivationFailedError,
+}
+
+
+def _translate_invalid_operation(
+    domain_error: DomainInvalidOperationError
+) -> ApplicationError:
+    # Map to appropriate application error based on operation
+    error_class = _OPERATION_ERRORS.get(domain_error.operation)
+    if error_class is not None:
+        return error_class(
+            reason=domain_error.reason,
+            cause=domain_error
+        )
+    return ApplicationError(
+        message=domain_error.message,
+        details=domain_error.details,
+        cause=domain_error
+    )
+
+
+def _translate_generic(domain_error: UserManagementDomainError) -> ApplicationError:
+    # Generic mapping for unknown domain errors
+    return ApplicationError(
+        message=domain_error.message,
+        details=domain_error.details,
+        cause=domain_error
+    )
+
+
+_DOMAIN_ERROR_TRANSLATORS: Dict[type, Callable[[Any], ApplicationError]] = {
+    DomainUserAlreadyExistsError: _translate_user_already_exists,
+    DomainUserNotFoundError: _translate_user_not_found,
+    DomainInvalidCredentialsError: _translate_invalid_credentials,
+    DomainUserDeactivatedError: _translate_user_deactivated,
+    DomainInvalidOperationError: _translate_invalid_operation,
+}
+
+
 def translate_domain_error(domain_error: UserManagementDomainError) -> ApplicationError:
     """Translate domain errors to application errors.
     
@@ -181,63 +263,13 @@ def translate_domain_error(domain_error: UserManagementDomainError) -> Applicati
     Returns:
         Appropriate application error.
     """
-    if isinstance(domain_error, DomainUserAlreadyExistsError):
-        return RegistrationFailedError(
-            reason="Email address is already registered",
-            details={'email': domain_error.email},
-            cause=domain_error
-        )
-    
-    elif isinstance(domain_error, DomainUserNotFoundError):
-        return UserNotFoundError(
-            identifier=domain_error.identifier,
-            cause=domain_error
-        )
-    
-    elif isinstance(domain_error, DomainInvalidCredentialsError):
-        return AuthenticationFailedError(
-            reason="Invalid email or password",
-            details={'email': domain_error.email},
-            cause=domain_error
-        )
-    
-    elif isinstance(domain_error, DomainUserDeactivatedError):
-        return AuthenticationFailedError(
-            reason="Account is deactivated",
-            details={'user_identifier': domain_error.user_identifier},
-            cause=domain_error
-        )
-    
-    elif isinstance(domain_error, DomainInvalidOperationError):
-        # Map to appropriate application error based on operation
-        operation = domain_error.operation
-        
-        if operation in ['update_profile']:
-            return ProfileUpdateFailedError(
-                reason=domain_error.reason,
-                cause=domain_error
-            )
-        elif operation in ['change_password']:
-            return PasswordChangeFailedError(
-                reason=domain_error.reason,
-                cause=domain_error
-            )
-        elif operation in ['deactivate']:
-            return UserDeactivationFailedError(
-                reason=domain_error.reason,
-                cause=domain_error
-            )
-        else:
-            return ApplicationError(
-                message=domain_error.message,
-                details=domain_error.details,
-                cause=domain_error
-            )
-    
-    else:
-        # Generic mapping for unknown domain errors
-        return ApplicationError(
-            message=domain_error.message,
-            details=getattr(domain_error, 'details', {}),
-            cause=domain_error
-        )
\ No newline at end of file
+    error_type = type(domain_error)
+    translator = _DOMAIN_ERROR_TRANSLATORS.get(error_type)
+    if translator is None:
+        # Subclasses of the mapped errors fall back to their nearest base
+        translator = _translate_generic
+        for base in error_type.__mro__[1:]:
+            if base in _DOMAIN_ERROR_TRANSLATORS:
+                translator = _DOMAIN_ERROR_TRANSLATORS[base]
+                break
+    return translator(domain_error)
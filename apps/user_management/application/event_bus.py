@@ -7,17 +7,23 @@ domain events within the modular monolith architecture.
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Type, TypeVar
+import os
+from itertools import groupby
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar
 
 from ..domain.events.user_events import DomainEvent
 
 
 T = TypeVar('T', bound=DomainEvent)
 EventHandler = Callable[[T], None]
+ErrorHandler = Callable[[DomainEvent, EventHandler, Exception], None]
 
 logger = logging.getLogger(__name__)
 
+# Per-event debug lines are only emitted when EVENT_BUS_TRACE is set, so
+# the publish path skips the logger entirely in normal operation.
+_TRACE = bool(os.environ.get('EVENT_BUS_TRACE'))
+
 
 class EventBus:
     """In-process event bus for domain event dispatching.
@@ -27,10 +33,24 @@ class EventBus:
     and provides error handling for failed subscriptions.
     """
     
-    def __init__(self) -> None:
-        """Initialize the event bus."""
-        self._subscribers: Dict[Type[DomainEvent], List[EventHandler]] = defaultdict(list)
+    def __init__(self, error_handler: Optional[ErrorHandler] = None) -> None:
+        """Initialize the event bus.
+        
+        Handlers are stored as immutable tuples that are rebuilt on
+        subscribe/unsubscribe, so publishing iterates a stable snapshot.
+        
+        Args:
+            error_handler: Optional callback receiving (event, handler, error)
+                when a handler raises. Replaces the default error log with
+                traceback, e.g. for handlers whose failures are expected.
+        """
+        self._subscribers: Dict[Type[DomainEvent], Tuple[EventHandler, ...]] = {}
         self._event_count = 0
+        self._error_handler = error_handler
+        # Maintained on subscribe/unsubscribe/clear so statistics don't
+        # have to walk the subscriber table
+        self._total_subscribers = 0
+        self._event_type_names: Optional[Tuple[str, ...]] = None
     
     
     
@@ -39,12 +59,23 @@ class EventBus:
     def subscribe(self, event_type: Type[T], handler: EventHandler[T]) -> None:
         """Subscribe a handler to a specific event type.
         
+        Subscribing the same handler to the same event type again adds it
+        again, so it receives each event once per subscription; a warning
+        is logged because this is usually a setup bug.
+        
         Args:
             event_type: The type of event to subscribe to.
             handler: The handler function to call when the event is published.
         """
-        self._subscribers[event_type].append(handler)
-        logger.debug(f"Subscribed handler {handler.__name__} to {event_type.__name__}")
+        handlers = self._subscribers.get(event_type, ())
+        if handler in handlers:
+            logger.warning("Handler %s is already subscribed to %s", handler.__name__, event_type.__name__)
+        
+        if not handlers:
+            self._event_type_names = None
+        self._subscribers[event_type] = (*handlers, handler)
+        self._total_subscribers += 1
+        logger.debug("Subscribed handler %s to %s", handler.__name__, event_type.__name__)
     
     
     
@@ -58,11 +89,20 @@ class EventBus:
             handler: The handler function to remove.
         """
         if event_type in self._subscribers:
+            handlers = list(self._subscribers[event_type])
             try:
-                self._subscribers[event_type].remove(handler)
-                logger.debug(f"Unsubscribed handler {handler.__name__} from {event_type.__name__}")
+                handlers.remove(handler)
             except ValueError:
-                logger.warning(f"Handler {handler.__name__} was not subscribed to {event_type.__name__}")
+                logger.warning("Handler %s was not subscribed to %s", handler.__name__, event_type.__name__)
+                return
+            
+            if handlers:
+                self._subscribers[event_type] = tuple(handlers)
+            else:
+                del self._subscribers[event_type]
+                self._event_type_names = None
+            self._total_subscribers -= 1
+            logger.debug("Unsubscribed handler %s from %s", handler.__name__, event_type.__name__)
     
     
     
@@ -75,21 +115,19 @@ class EventBus:
             event: The domain event to publish.
         """
         event_type = type(event)
-        handlers = self._subscribers.get(event_type, [])
+        handlers = self._subscribers.get(event_type)
         
         self._event_count += 1
-        logger.debug(f"Publishing event {event_type.__name__} (#{self._event_count}) to {len(handlers)} handlers")
+        if not handlers:
+            return
         
-        for handler in handlers:
-            try:
-                handler(event)
-                logger.debug(f"Successfully handled event {event_type.__name__} with {handler.__name__}")
-            except Exception as e:
-                logger.error(
-                    f"Error handling event {event_type.__name__} with {handler.__name__}: {e}",
-                    exc_info=True
-                )
-                # Continue with other handlers even if one fails
+        if _TRACE:
+            logger.debug(
+                "Publishing event %s (#%d) to %d handlers",
+                event_type.__name__, self._event_count, len(handlers)
+            )
+        
+        self._dispatch(event_type, handlers, (event,))
     
     
     
@@ -98,11 +136,71 @@ class EventBus:
     def publish_all(self, events: List[DomainEvent]) -> None:
         """Publish multiple events in order.
         
+        Consecutive events of the same type are delivered as one batch,
+        so the subscriber lookup happens once per run rather than once
+        per event. Ordering between runs is preserved. Within a run,
+        delivery is handler-major: for a run [e1, e2] and handlers
+        [h1, h2], the calls are h1(e1), h1(e2), h2(e1), h2(e2).
+        
         Args:
             events: List of domain events to publish.
         """
-        for event in events:
-            self.publish(event)
+        for event_type, run in groupby(events, key=type):
+            batch = tuple(run)
+            self._event_count += len(batch)
+            
+            handlers = self._subscribers.get(event_type)
+            if not handlers:
+                continue
+            
+            if _TRACE:
+                logger.debug(
+                    "Publishing %d %s events to %d handlers",
+                    len(batch), event_type.__name__, len(handlers)
+                )
+            
+            self._dispatch(event_type, handlers, batch)
+    
+    
+    
+    
+    
+    def _dispatch(
+        self,
+        event_type: Type[DomainEvent],
+        handlers: Iterable[EventHandler],
+        events: Sequence[DomainEvent],
+    ) -> None:
+        """Deliver a batch of same-typed events to each handler.
+        
+        Each handler receives the whole batch, in order, before the next
+        handler is called.
+        
+        Args:
+            event_type: The type shared by every event in the batch.
+            handlers: Handlers subscribed to the event type.
+            events: Events to deliver, in publication order.
+        """
+        for handler in handlers:
+            for event in events:
+                try:
+                    handler(event)
+                except Exception as e:
+                    if self._error_handler is not None:
+                        self._error_handler(event, handler, e)
+                    else:
+                        logger.error(
+                            "Error handling event %s with %s: %s",
+                            event_type.__name__, handler.__name__, e,
+                            exc_info=True
+                        )
+                    # Continue with other handlers even if one fails
+                    continue
+                if _TRACE:
+                    logger.debug(
+                        "Successfully handled event %s with %s",
+                        event_type.__name__, handler.__name__
+                    )
     
     
     
@@ -117,7 +215,7 @@ class EventBus:
         Returns:
             Number of subscribers for the event type.
         """
-        return len(self._subscribers.get(event_type, []))
+        return len(self._subscribers.get(event_type, ()))
     
     
     
@@ -129,7 +227,7 @@ class EventBus:
         Returns:
             Total number of subscribed handlers.
         """
-        return sum(len(handlers) for handlers in self._subscribers.values())
+        return self._total_subscribers
     
     
     
@@ -155,10 +253,13 @@ class EventBus:
         """
         if event_type:
             if event_type in self._subscribers:
-                del self._subscribers[event_type]
-                logger.debug(f"Cleared all subscribers for {event_type.__name__}")
+                self._total_subscribers -= len(self._subscribers.pop(event_type))
+                self._event_type_names = None
+                logger.debug("Cleared all subscribers for %s", event_type.__name__)
         else:
             self._subscribers.clear()
+            self._total_subscribers = 0
+            self._event_type_names = None
             logger.debug("Cleared all subscribers for all event types")
     
     
@@ -171,11 +272,14 @@ class EventBus:
         Returns:
             Dictionary containing event bus statistics.
         """
+        if self._event_type_names is None:
+            self._event_type_names = tuple(event_type.__name__ for event_type in self._subscribers)
+        
         return {
             'total_event_types': len(self._subscribers),
-            'total_subscribers': self.get_total_subscribers(),
+            'total_subscribers': self._total_subscribers,
             'events_published': self._event_count,
-            'event_types': [event_type.__name__ for event_type in self._subscribers.keys()]
+            'event_types': list(self._event_type_names)
         }
     
     
@@ -184,11 +288,10 @@ class EventBus:
     
     def __str__(self) -> str:
         """Return string representation."""
-        stats = self.get_statistics()
         return (
-            f"EventBus(event_types={stats['total_event_types']}, "
-            f"subscribers={stats['total_subscribers']}, "
-            f"published={stats['events_published']})"
+            f"EventBus(event_types={len(self._subscribers)}, "
+            f"subscribers={self._total_subscribers}, "
+            f"published={self._event_count})"
         )
 
 
@@ -10,7 +10,11 @@ from typing import TYPE_CHECKING, Protocol
 
 from django.conf import settings
 
-from ...domain.errors import UserManagementDomainError
+from ...domain.errors import (
+    InvalidCredentialsError,
+    UserDeactivatedError,
+    UserManagementDomainError,
+)
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.services.password_policy import TokenProvider
 from ...domain.value_objects.email import Email
@@ -27,11 +31,11 @@ logger = logging.getLogger(__name__)
 class PasswordService(Protocol):
     """Protocol for password service operations."""
     
-    async def hash_password(self, password: str) -> str:
+    def hash_password(self, password: str) -> str:
         """Hash a password."""
         ...
     
-    async def verify_password(self, password: str, hashed: str) -> bool:
+    def verify_password(self, password: str, hashed: str) -> bool:
         """Verify a password against its hash."""
         ...
 
@@ -77,7 +81,7 @@ class AuthenticateUserHandler:
         Raises:
             ApplicationError: If authentication fails for any reason.
         """
-        logger.info(f"Executing user authentication for email: {command.email}")
+        logger.info("Executing user authentication for email: %s", command.email)
         
         try:
             # Create domain value object
@@ -86,8 +90,7 @@ class AuthenticateUserHandler:
             # Find user by email
             user = self._user_repository.find_by_email(email)
             if user is None:
-                logger.warning(f"Authentication failed: User not found: {command.email}")
-                from ...domain.errors import InvalidCredentialsError
+                logger.warning("Authentication failed: User not found: %s", command.email)
                 raise InvalidCredentialsError(email.value)
             
             # Verify password
@@ -97,36 +100,25 @@ class AuthenticateUserHandler:
                 current_hash
             )
             if not is_valid:
-                logger.warning(f"Authentication failed: Invalid password for email: {command.email}")
-                from ...domain.errors import InvalidCredentialsError
+                logger.warning("Authentication failed: Invalid password for email: %s", command.email)
                 raise InvalidCredentialsError(email.value)
             
             # Check if user is active (business rule validation)
             if not user.is_active():
-                logger.warning(f"Authentication failed: User is not active: {command.email}")
-                from ...domain.errors import UserDeactivatedError
+                logger.warning("Authentication failed: User is not active: %s", command.email)
                 raise UserDeactivatedError(user.id.value)
             
             # Generate JWT token using the token provider
-            logger.info(f"Generating JWT token for user: {command.email}")
+            logger.info("Generating JWT token for user: %s", command.email)
             access_token = self._token_provider.issue_token(user.id)
             
-            logger.info(f"User successfully authenticated: {user.id.value}")
+            logger.info("User successfully authenticated: %s", user.id.value)
             
             # Create user DTO
             try:
-                user_dto = UserDTO(
-                    id=str(user.id.value),
-                    email=user.email.value,
-                    first_name=user.first_name.value,
-                    last_name=user.last_name.value,
-                    full_name=f"{user.first_name.value} {user.last_name.value}",
-                    status=user.status.value,
-                    created_at=user.created_at,
-                    updated_at=user.updated_at
-                )
+                user_dto = UserDTO.from_entity(user)
             except Exception as e:
-                logger.error(f"Failed to create UserDTO: {e}")
+                logger.error("Failed to create UserDTO: %s", e)
                 raise ValueError(f"Failed to create user DTO: {e}") from e
             
             # Return authentication result
@@ -138,19 +130,17 @@ class AuthenticateUserHandler:
                 )
                 return auth_result
             except Exception as e:
-                logger.error(f"Failed to create AuthResultDTO: {e}")
+                logger.error("Failed to create AuthResultDTO: %s", e)
                 raise ValueError(f"Failed to create auth result: {e}") from e
             
         except UserManagementDomainError as e:
-            logger.error(f"Domain error during authentication: {e}")
+            logger.error("Domain error during authentication: %s", e)
             raise translate_domain_error(e) from e
         except ValueError as e:
-            logger.error(f"Validation error during authentication: {e}")
+            logger.error("Validation error during authentication: %s", e)
             # Convert to domain error for consistent handling
-            from ...domain.errors import InvalidCredentialsError
             raise InvalidCredentialsError(command.email) from e
         except Exception as e:
-            logger.error(f"Unexpected error during authentication: {e}", exc_info=True)
+            logger.error("Unexpected error during authentication: %s", e, exc_info=True)
             # Re-raise as domain error to maintain error handling consistency
-            from ...domain.errors import InvalidCredentialsError
             raise InvalidCredentialsError(command.email) from e
\ No newline at end of file
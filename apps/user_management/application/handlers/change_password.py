@@ -4,10 +4,18 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Protocol
 
-from ...domain.errors import UserManagementDomainError
-from ...domain.events.user_events import DomainEvent
+from django.utils import timezone
+
+from ...domain.errors import (
+    InvalidCredentialsError,
+    InvalidOperationError,
+    UserManagementDomainError,
+    UserNotFoundError,
+)
+from ...domain.events.user_events import DomainEvent, UserPasswordChanged
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.value_objects.password_hash import PasswordHash
 from ...domain.value_objects.user_id import UserId
@@ -23,16 +31,16 @@ logger = logging.getLogger(__name__)
 class PasswordService(Protocol):
     """Protocol for password service operations."""
     
-    async def hash_password(self, password: str) -> str:
+    def hash_password(self, password: str) -> str:
         """Hash a password."""
         ...
     
-    async def verify_password(self, password: str, hashed: str) -> bool:
+    def verify_password(self, password: str, hashed: str) -> bool:
         """Verify a password against its hash."""
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChangePasswordResult:
     """Result of password change operation."""
     events: list[DomainEvent]
@@ -56,15 +64,19 @@ class ChangePasswordHandler:
         self,
         user_repository: UserRepository,
         password_service: PasswordService,
+        clock: Callable[[], datetime] = timezone.now,
     ) -> None:
         """Initialize the change password handler.
         
         Args:
             user_repository: Repository for user persistence operations.
             password_service: Service for password hashing and verification operations.
+            clock: Callable returning the current timezone-aware time. Its
+                value is the updated_at the repository stores for the change.
         """
         self._user_repository = user_repository
         self._password_service = password_service
+        self._clock = clock
     
     def handle(self, command: ChangePasswordCommand) -> ChangePasswordResult:
         """Execute the password change use case.
@@ -80,55 +92,51 @@ class ChangePasswordHandler:
             InvalidCredentialsError: If the old password is incorrect.
             InvalidOperationError: If the user is not active.
         """
-        logger.info(f"Executing password change for user ID: {command.user_id}")
+        logger.info("Executing password change for user ID: %s", command.user_id)
         
         try:
             # Step 1: Validate the password change request
-            logger.debug(f"Validating password change request for user: {command.user_id}")
+            logger.debug("Validating password change request for user: %s", command.user_id)
             user_id = UserId.from_string(command.user_id)
             
             # Step 2: Find user by ID
-            logger.debug(f"Finding user by ID: {command.user_id}")
+            logger.debug("Finding user by ID: %s", command.user_id)
             user = self._user_repository.find_by_id(user_id)
             if user is None:
-                logger.warning(f"Password change failed: User not found: {command.user_id}")
-                from ...domain.errors import UserNotFoundError
+                logger.warning("Password change failed: User not found: %s", command.user_id)
                 raise UserNotFoundError(user_id.value)
             
             # Step 3: Verify current password
-            logger.debug(f"Verifying current password for user: {command.user_id}")
+            logger.debug("Verifying current password for user: %s", command.user_id)
             current_hash = user.password_hash.value if hasattr(user.password_hash, 'value') else user.password_hash
             is_valid = self._password_service.verify_password(
                 command.old_password,
                 current_hash
             )
             if not is_valid:
-                logger.warning(f"Password change failed: Invalid old password for user: {command.user_id}")
-                from ...domain.errors import InvalidCredentialsError
+                logger.warning("Password change failed: Invalid old password for user: %s", command.user_id)
                 raise InvalidCredentialsError(user.email.value)
             
             # Step 4: Check if user is active (business rule)
-            logger.debug(f"Checking user status for password change: {command.user_id}")
+            logger.debug("Checking user status for password change: %s", command.user_id)
             if not user.is_active():
-                logger.warning(f"Password change failed: User is inactive: {command.user_id}")
-                from ...domain.errors import InvalidOperationError
+                logger.warning("Password change failed: User is inactive: %s", command.user_id)
                 raise InvalidOperationError(
                     "change_password",
                     "Cannot change password for an inactive user"
                 )
             
             # Step 5: Hash new password and update
-            logger.debug(f"Hashing new password for user: {command.user_id}")
+            logger.debug("Hashing new password for user: %s", command.user_id)
             new_password_hash = self._password_service.hash_password(command.new_password)
             user.password_hash = PasswordHash(new_password_hash)
             
-            # Step 6: Update user entity with timestamp
-            from datetime import datetime
-            user.updated_at = datetime.utcnow()
+            # Step 6: Update user entity with timestamp; the repository
+            # persists the entity's updated_at as is
+            user.updated_at = self._clock()
             
             # Step 7: Manually trigger the password changed event
-            logger.debug(f"Creating password changed event for user: {command.user_id}")
-            from ...domain.events.user_events import UserPasswordChanged
+            logger.debug("Creating password changed event for user: %s", command.user_id)
             
             password_changed_event = UserPasswordChanged(
                 aggregate_id=user.id,
@@ -137,19 +145,15 @@ class ChangePasswordHandler:
             user._add_domain_event(password_changed_event)
             
             # Step 8: Persist the updated user
-            logger.debug(f"Persisting updated user: {command.user_id}")
+            logger.debug("Persisting updated user: %s", command.user_id)
             self._user_repository.update(user)
             
             # Step 9: Collect domain events for publishing
-            events = user.get_domain_events()
-            user.clear_domain_events()
-            logger.info(f"Password successfully changed for user: {command.user_id}, collected {len(events)} domain events")
+            events = user.pop_domain_events()
+            logger.info("Password successfully changed for user: %s, collected %d domain events", command.user_id, len(events))
             
             return ChangePasswordResult(events=events)
             
         except UserManagementDomainError as e:
-            logger.error(f"Domain error during password change for user {command.user_id}: {str(e)}")
-            raise translate_domain_error(e) from e
-        except Exception as e:
-            logger.error(f"Unexpected error during password change for user {command.user_id}: {str(e)}")
+            logger.error("Domain error during password change for user %s: %s", command.user_id, e)
             raise translate_domain_error(e) from e
\ No newline at end of file
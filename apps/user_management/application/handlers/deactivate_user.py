@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from ...domain.errors import UserManagementDomainError
+from ...domain.errors import UserManagementDomainError, UserNotFoundError
 from ...domain.events.user_events import DomainEvent
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.value_objects.user_id import UserId
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeactivateUserResult:
     """Result of user deactivation operation."""
     events: list[DomainEvent]
@@ -57,39 +57,34 @@ class DeactivateUserHandler:
         Raises:
             UserNotFoundError: If the user doesn't exist.
         """
-        logger.info(f"Executing user deactivation for user ID: {command.user_id}")
+        logger.info("Executing user deactivation for user ID: %s", command.user_id)
         
         try:
             # Step 1: Validate the deactivation request
-            logger.debug(f"Validating deactivation request for user: {command.user_id}")
+            logger.debug("Validating deactivation request for user: %s", command.user_id)
             user_id = UserId.from_string(command.user_id)
             
             # Step 2: Find user by ID
-            logger.debug(f"Finding user by ID: {command.user_id}")
+            logger.debug("Finding user by ID: %s", command.user_id)
             user = self._user_repository.find_by_id(user_id)
             if user is None:
-                logger.warning(f"Deactivation failed: User not found: {command.user_id}")
-                from ...domain.errors import UserNotFoundError
+                logger.warning("Deactivation failed: User not found: %s", command.user_id)
                 raise UserNotFoundError(user_id.value)
             
             # Step 3: Deactivate user account (domain method handles business rules)
-            logger.debug(f"Deactivating user account for user: {command.user_id}, reason: {command.reason}")
+            logger.debug("Deactivating user account for user: %s, reason: %s", command.user_id, command.reason)
             user.deactivate(reason=command.reason)
             
             # Step 4: Persist the updated user
-            logger.debug(f"Persisting deactivated user: {command.user_id}")
+            logger.debug("Persisting deactivated user: %s", command.user_id)
             self._user_repository.update(user)
             
             # Step 5: Collect domain events for publishing
-            events = user.get_domain_events()
-            user.clear_domain_events()
-            logger.info(f"User successfully deactivated: {command.user_id}, collected {len(events)} domain events")
+            events = user.pop_domain_events()
+            logger.info("User successfully deactivated: %s, collected %d domain events", command.user_id, len(events))
             
             return DeactivateUserResult(events=events)
             
         except UserManagementDomainError as e:
-            logger.error(f"Domain error during user deactivation for user {command.user_id}: {str(e)}")
-            raise translate_domain_error(e) from e
-        except Exception as e:
-            logger.error(f"Unexpected error during user deactivation for user {command.user_id}: {str(e)}")
+            logger.error("Domain error during user deactivation for user %s: %s", command.user_id, e)
             raise translate_domain_error(e) from e
\ No newline at end of file
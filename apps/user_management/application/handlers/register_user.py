@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol
 
 from ...domain.entities.user import User
-from ...domain.errors import UserManagementDomainError
+from ...domain.errors import UserAlreadyExistsError, UserManagementDomainError
 from ...domain.events.user_events import DomainEvent, UserRegistered
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.value_objects.email import Email
@@ -32,16 +32,16 @@ logger = logging.getLogger(__name__)
 class PasswordService(Protocol):
     """Protocol for password service operations."""
     
-    async def hash_password(self, password: str) -> str:
+    def hash_password(self, password: str) -> str:
         """Hash a password."""
         ...
     
-    async def verify_password(self, password: str, hashed: str) -> bool:
+    def verify_password(self, password: str, hashed: str) -> bool:
         """Verify a password against its hash."""
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterUserResult:
     """Result of user registration operation."""
     user_dto: UserDTO
@@ -86,11 +86,11 @@ class RegisterUserHandler:
         Raises:
             ApplicationError: If registration fails for any reason.
         """
-        logger.info(f"Executing user registration for email: {command.email}")
+        logger.info("Executing user registration for email: %s", command.email)
         
         try:
             # Step 1: Validate the registration request
-            logger.debug(f"Validating registration request for email: {command.email}")
+            logger.debug("Validating registration request for email: %s", command.email)
             
             # Create domain value objects
             email = Email(command.email)
@@ -98,11 +98,9 @@ class RegisterUserHandler:
             last_name = LastName(command.last_name)
             
             # Step 2: Check if user already exists
-            logger.debug(f"Checking if user with email {command.email} already exists")
-            existing_user = self._user_repository.find_by_email(email)
-            if existing_user is not None:
-                logger.warning(f"Registration failed: User with email {command.email} already exists")
-                from ...domain.errors import UserAlreadyExistsError
+            logger.debug("Checking if user with email %s already exists", command.email)
+            if self._user_repository.exists_by_email(email):
+                logger.warning("Registration failed: User with email %s already exists", command.email)
                 raise UserAlreadyExistsError(email.value)
             
             # Step 3: Hash the password
@@ -111,7 +109,7 @@ class RegisterUserHandler:
             password_hash = PasswordHash(hashed_password)
             
             # Step 4: Create new user domain entity
-            logger.debug(f"Creating new user entity for {command.email}")
+            logger.debug("Creating new user entity for %s", command.email)
             user = User.create(
                 email=email,
                 password_hash=password_hash,
@@ -121,26 +119,16 @@ class RegisterUserHandler:
             )
             
             # Step 5: Persist the user
-            logger.debug(f"Persisting user {user.id} to repository")
+            logger.debug("Persisting user %s to repository", user.id)
             self._user_repository.save(user)
             
             # Step 6: Create user DTO for response
-            logger.debug(f"Creating user DTO for successful registration of {command.email}")
-            user_dto = UserDTO(
-                id=str(user.id.value),
-                email=user.email.value,
-                first_name=user.first_name.value,
-                last_name=user.last_name.value,
-                full_name=f"{user.first_name.value} {user.last_name.value}",
-                status=user.status.value,
-                created_at=user.created_at,
-                updated_at=user.updated_at
-            )
+            logger.debug("Creating user DTO for successful registration of %s", command.email)
+            user_dto = UserDTO.from_entity(user)
             
             # Step 7: Collect domain events for publishing
-            events = user.get_domain_events()
-            user.clear_domain_events()
-            logger.info(f"User registration completed successfully for {command.email}, collected {len(events)} domain events")
+            events = user.pop_domain_events()
+            logger.info("User registration completed successfully for %s, collected %d domain events", command.email, len(events))
             
             return RegisterUserResult(
                 user_dto=user_dto,
@@ -148,8 +136,8 @@ class RegisterUserHandler:
             )
             
         except UserManagementDomainError as e:
-            logger.error(f"Domain error during user registration for {command.email}: {str(e)}")
+            logger.error("Domain error during user registration for %s: %s", command.email, e)
             raise translate_domain_error(e) from e
         except Exception as e:
-            logger.error(f"Unexpected error during user registration for {command.email}: {str(e)}")
+            logger.error("Unexpected error during user registration for %s: %s", command.email, e)
             raise ApplicationError(f"Failed to register user: {str(e)}") from e
\ No newline at end of file
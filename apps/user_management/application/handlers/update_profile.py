@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
-from ...domain.errors import UserManagementDomainError
+from ...domain.errors import UserManagementDomainError, UserNotFoundError
 from ...domain.events.user_events import DomainEvent
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.value_objects.first_name import FirstName
@@ -22,7 +22,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateProfileResult:
     """Result of profile update operation."""
     user_dto: UserDTO
@@ -61,67 +61,53 @@ class UpdateProfileHandler:
         Raises:
             UserNotFoundError: If the user doesn't exist.
         """
-        logger.info(f"Executing profile update for user ID: {command.user_id}")
+        logger.info("Executing profile update for user ID: %s", command.user_id)
         
         try:
             # Step 1: Validate the profile update request
-            logger.debug(f"Validating profile update request for user: {command.user_id}")
+            logger.debug("Validating profile update request for user: %s", command.user_id)
             user_id = UserId.from_string(command.user_id)
             
             # Step 2: Find user by ID
-            logger.debug(f"Finding user by ID: {command.user_id}")
+            logger.debug("Finding user by ID: %s", command.user_id)
             user = self._user_repository.find_by_id(user_id)
             if user is None:
-                logger.warning(f"Profile update failed: User not found: {command.user_id}")
-                from ...domain.errors import UserNotFoundError
+                logger.warning("Profile update failed: User not found: %s", command.user_id)
                 raise UserNotFoundError(user_id.value)
             
             # Step 3: Prepare profile update values
-            logger.debug(f"Preparing profile update values for user: {command.user_id}")
-            logger.debug(f"Command new_email: {command.new_email}")
-            logger.debug(f"Command new_first_name: {command.new_first_name}")
-            logger.debug(f"Command new_last_name: {command.new_last_name}")
+            logger.debug("Preparing profile update values for user: %s", command.user_id)
+            logger.debug("Command new_email: %s", command.new_email)
+            logger.debug("Command new_first_name: %s", command.new_first_name)
+            logger.debug("Command new_last_name: %s", command.new_last_name)
             
             new_first_name = FirstName(command.new_first_name) if command.new_first_name else None
             new_last_name = LastName(command.new_last_name) if command.new_last_name else None
             
-            logger.debug(f"Prepared new_first_name: {new_first_name}")
-            logger.debug(f"Prepared new_last_name: {new_last_name}")
+            logger.debug("Prepared new_first_name: %s", new_first_name)
+            logger.debug("Prepared new_last_name: %s", new_last_name)
             
             # Step 4: Update user profile (domain method handles validation)
-            logger.debug(f"Updating user profile for user: {command.user_id}")
+            logger.debug("Updating user profile for user: %s", command.user_id)
             user.update_profile(
                 new_first_name=new_first_name, 
                 new_last_name=new_last_name
             )
             
             # Step 5: Persist the updated user
-            logger.debug(f"Persisting updated user: {command.user_id}")
+            logger.debug("Persisting updated user: %s", command.user_id)
             self._user_repository.update(user)
             
             # Step 6: Create user DTO for response
-            logger.debug(f"Creating user DTO for successful profile update of user: {command.user_id}")
-            user_dto = UserDTO(
-                id=str(user.id.value),
-                email=user.email.value,
-                first_name=user.first_name.value,
-                last_name=user.last_name.value,
-                full_name=f"{user.first_name.value} {user.last_name.value}",
-                status=user.status.value,
-                created_at=user.created_at,
-                updated_at=user.updated_at
-            )
+            logger.debug("Creating user DTO for successful profile update of user: %s", command.user_id)
+            user_dto = UserDTO.from_entity(user)
             
             # Step 7: Collect domain events for publishing
-            events = user.get_domain_events()
-            user.clear_domain_events()
-            logger.info(f"Profile successfully updated for user: {command.user_id}, collected {len(events)} domain events")
+            events = user.pop_domain_events()
+            logger.info("Profile successfully updated for user: %s, collected %d domain events", command.user_id, len(events))
             
             return UpdateProfileResult(user_dto=user_dto, events=events)
             
         except UserManagementDomainError as e:
-            logger.error(f"Domain error during profile update for user {command.user_id}: {str(e)}")
-            raise translate_domain_error(e) from e
-        except Exception as e:
-            logger.error(f"Unexpected error during profile update for user {command.user_id}: {str(e)}")
+            logger.error("Domain error during profile update for user %s: %s", command.user_id, e)
             raise translate_domain_error(e) from e
\ No newline at end of file
@@ -7,7 +7,7 @@ all user management use cases by wiring handlers with event bus.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Optional, Protocol
 
 from ..domain.repositories.user_repository import UserRepository
 from .commands import (
@@ -19,7 +19,7 @@ from .commands import (
 )
 from .dto import AuthResultDTO, UserDTO
 from .errors import ApplicationError
-from .event_bus import EventBus
+from .event_bus import EventBus, event_bus as default_event_bus
 from .handlers import (
     AuthenticateUserHandler,
     ChangePasswordHandler,
@@ -36,11 +36,11 @@ if TYPE_CHECKING:
 class PasswordService(Protocol):
     """Protocol for password service operations."""
     
-    async def hash_password(self, password: str) -> str:
+    def hash_password(self, password: str) -> str:
         """Hash a password."""
         ...
     
-    async def verify_password(self, password: str, hashed: str) -> bool:
+    def verify_password(self, password: str, hashed: str) -> bool:
         """Verify a password against its hash."""
         ...
 
@@ -59,14 +59,17 @@ class UserManagementService:
         self, 
         user_repository: UserRepository,
         password_service: PasswordService,
+        event_bus: Optional[EventBus] = None,
     ) -> None:
         """Initialize the user management service.
         
         Args:
             user_repository: Repository for user persistence.
             password_service: Service for password operations.
+            event_bus: Event bus to publish on. Defaults to the global
+                application bus shared with infrastructure subscribers.
         """
-        self._event_bus = EventBus()
+        self._event_bus = event_bus if event_bus is not None else default_event_bus
         
         # Set up event subscribers
         self._setup_event_subscribers()
@@ -93,7 +96,7 @@ class UserManagementService:
         self._event_bus.subscribe(UserDeactivated, log_user_events)
         self._event_bus.subscribe(UserProfileUpdated, log_user_events)
     
-    async def register_user(self, command: RegisterUserCommand) -> UserDTO:
+    def register_user(self, command: RegisterUserCommand) -> UserDTO:
         """Register a new user.
         
         Args:
@@ -106,16 +109,16 @@ class UserManagementService:
             ApplicationError: If registration fails.
         """
         try:
-            result = await self._register_handler.handle(command)
-            await self._publish_events(result.events)
+            result = self._register_handler.handle(command)
+            self._publish_events(result.events)
             return result.user_dto
         except Exception as e:
-            logger.error(f"Failed to register user: {e}", exc_info=True)
+            logger.error("Failed to register user: %s", e, exc_info=True)
             if isinstance(e, ApplicationError):
                 raise
             raise ApplicationError(f"Registration failed: {e}") from e
     
-    async def authenticate_user(self, command: AuthenticateUserCommand) -> AuthResultDTO:
+    def authenticate_user(self, command: AuthenticateUserCommand) -> AuthResultDTO:
         """Authenticate a user.
         
         Args:
@@ -128,14 +131,14 @@ class UserManagementService:
             ApplicationError: If authentication fails.
         """
         try:
-            return await self._authenticate_handler.handle(command)
+            return self._authenticate_handler.handle(command)
         except Exception as e:
-            logger.error(f"Failed to authenticate user: {e}", exc_info=True)
+            logger.error("Failed to authenticate user: %s", e, exc_info=True)
             if isinstance(e, ApplicationError):
                 raise
             raise ApplicationError(f"Authentication failed: {e}") from e
     
-    async def change_password(self, command: ChangePasswordCommand) -> None:
+    def change_password(self, command: ChangePasswordCommand) -> None:
         """Change a user's password.
         
         Args:
@@ -145,15 +148,15 @@ class UserManagementService:
             ApplicationError: If password change fails.
         """
         try:
-            result = await self._change_password_handler.handle(command)
-            await self._publish_events(result.events)
+            result = self._change_password_handler.handle(command)
+            self._publish_events(result.events)
         except Exception as e:
-            logger.error(f"Failed to change password: {e}", exc_info=True)
+            logger.error("Failed to change password: %s", e, exc_info=True)
             if isinstance(e, ApplicationError):
                 raise
             raise ApplicationError(f"Password change failed: {e}") from e
     
-    async def update_profile(self, command: UpdateProfileCommand) -> UserDTO:
+    def update_profile(self, command: UpdateProfileCommand) -> UserDTO:
         """Update a user's profile.
         
         Args:
@@ -166,16 +169,16 @@ class UserManagementService:
             ApplicationError: If profile update fails.
         """
         try:
-            result = await self._update_profile_handler.handle(command)
-            await self._publish_events(result.events)
+            result = self._update_profile_handler.handle(command)
+            self._publish_events(result.events)
             return result.user_dto
         except Exception as e:
-            logger.error(f"Failed to update profile: {e}", exc_info=True)
+            logger.error("Failed to update profile: %s", e, exc_info=True)
             if isinstance(e, ApplicationError):
                 raise
             raise ApplicationError(f"Profile update failed: {e}") from e
     
-    async def deactivate_user(self, command: DeactivateUserCommand) -> None:
+    def deactivate_user(self, command: DeactivateUserCommand) -> None:
         """Deactivate a user.
         
         Args:
@@ -185,19 +188,18 @@ class UserManagementService:
             ApplicationError: If deactivation fails.
         """
         try:
-            result = await self._deactivate_handler.handle(command)
-            await self._publish_events(result.events)
+            result = self._deactivate_handler.handle(command)
+            self._publish_events(result.events)
         except Exception as e:
-            logger.error(f"Failed to deactivate user: {e}", exc_info=True)
+            logger.error("Failed to deactivate user: %s", e, exc_info=True)
             if isinstance(e, ApplicationError):
                 raise
             raise ApplicationError(f"User deactivation failed: {e}") from e
     
-    async def _publish_events(self, events: list[DomainEvent]) -> None:
+    def _publish_events(self, events: list[DomainEvent]) -> None:
         """Publish domain events through the event bus.
         
         Args:
             events: List of domain events to publish.
         """
-        for event in events:
-            self._event_bus.publish(event)  # Not async
\ No newline at end of file
+        self._event_bus.publish_all(events)
\ No newline at end of file
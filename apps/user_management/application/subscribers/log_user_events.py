@@ -22,10 +22,11 @@ def log_user_events(event: Any) -> None:
         event: Any user domain event.
     """
     try:
+        aggregate_id = str(event.aggregate_id)
         event_data = {
             'event_type': event.event_type,
             'event_id': str(event.event_id),
-            'aggregate_id': str(event.aggregate_id),
+            'aggregate_id': aggregate_id,
             'occurred_at': event.occurred_at.isoformat(),
             'event_version': event.event_version
         }
@@ -35,10 +36,11 @@ def log_user_events(event: Any) -> None:
             event_data['data'] = event._get_event_data()
         
         logger.info(
-            f"User event logged: {event.event_type}",
+            "User event logged: %s",
+            event.event_type,
             extra={
                 'event_data': event_data,
-                'user_id': str(event.aggregate_id),
+                'user_id': aggregate_id,
                 'event_type': event.event_type
             }
         )
@@ -51,7 +53,8 @@ def log_user_events(event: Any) -> None:
         
     except Exception as e:
         logger.error(
-            f"Failed to log user event {getattr(event, 'event_type', 'unknown')}: {e}",
+            "Failed to log user event %s: %s",
+            getattr(event, 'event_type', 'unknown'), e,
             exc_info=True
         )
         # Don't re-raise - logging failure shouldn't break the operation
\ No newline at end of file
@@ -29,7 +29,7 @@ if TYPE_CHECKING:
     from ..events.user_events import DomainEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User aggregate root entity.
     
@@ -51,7 +51,7 @@ class User:
     first_name: FirstName
     last_name: LastName
     created_at: datetime = field(default_factory=timezone.now)
-    updated_at: datetime = field(default_factory=lambda: timezone.now())
+    updated_at: datetime = field(default_factory=timezone.now)
     status: UserStatus = UserStatus.ACTIVE
     
     # Domain events that occurred during this session
@@ -166,14 +166,19 @@ class User:
         old_first_name = self.first_name
         old_last_name = self.last_name
         
-        # Update fields if provided
-        if new_email is not None:
+        # Work out what actually changes once; None means "not provided"
+        email_changed = new_email is not None and new_email != old_email
+        first_name_changed = new_first_name is not None and new_first_name != old_first_name
+        last_name_changed = new_last_name is not None and new_last_name != old_last_name
+        
+        # Update fields if changed
+        if email_changed:
             self.email = new_email
         
-        if new_first_name is not None:
+        if first_name_changed:
             self.first_name = new_first_name
             
-        if new_last_name is not None:
+        if last_name_changed:
             self.last_name = new_last_name
         
         # Update timestamp
@@ -183,19 +188,17 @@ class User:
         self._validate_invariants()
         
         # Publish event if anything changed
-        if (new_email != old_email or 
-            new_first_name != old_first_name or 
-            new_last_name != old_last_name):
+        if email_changed or first_name_changed or last_name_changed:
             from ..events.user_events import UserProfileUpdated
             
             self._add_domain_event(UserProfileUpdated(
                 aggregate_id=self.id,
                 old_email=old_email,
-                new_email=new_email if new_email != old_email else None,
+                new_email=new_email if email_changed else None,
                 old_first_name=old_first_name,
-                new_first_name=new_first_name if new_first_name != old_first_name else None,
+                new_first_name=new_first_name if first_name_changed else None,
                 old_last_name=old_last_name,
-                new_last_name=new_last_name if new_last_name != old_last_name else None
+                new_last_name=new_last_name if last_name_changed else None
             ))
     
     
@@ -392,6 +395,20 @@ class User:
     
     
     
+    def pop_domain_events(self) -> list[DomainEvent]:
+        """Return the pending domain events and clear them in one step.
+        
+        Returns:
+            List of domain events that occurred since the last pop/clear.
+        """
+        events, self._domain_events = self._domain_events, []
+        return events
+    
+    
+    
+    
+    
+    
     def _add_domain_event(self, event: DomainEvent) -> None:
         """Add a domain event to the events list.
         
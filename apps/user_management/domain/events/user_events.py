@@ -29,7 +29,7 @@ class DomainEvent(ABC):
     
     aggregate_id: UserId
     event_id: uuid.UUID = field(default_factory=uuid.uuid4)
-    occurred_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
     event_version: int = field(default=1)
     
     @property
@@ -81,7 +81,7 @@ class UserRegistered:
     first_name: FirstName
     last_name: LastName
     event_id: uuid.UUID = field(default_factory=uuid.uuid4)
-    occurred_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
     event_version: int = field(default=1)
     
     @property
@@ -124,7 +124,7 @@ class UserPasswordChanged:
     aggregate_id: UserId
     email: Email
     event_id: uuid.UUID = field(default_factory=uuid.uuid4)
-    occurred_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
     event_version: int = field(default=1)
     
     @property
@@ -165,7 +165,7 @@ class UserDeactivated:
     email: Email
     reason: Optional[str] = None
     event_id: uuid.UUID = field(default_factory=uuid.uuid4)
-    occurred_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
     event_version: int = field(default=1)
     
     @property
@@ -211,7 +211,7 @@ class UserProfileUpdated:
     old_last_name: Optional[LastName]
     new_last_name: Optional[LastName]
     event_id: uuid.UUID = field(default_factory=uuid.uuid4)
-    occurred_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
     event_version: int = field(default=1)
     
     @property
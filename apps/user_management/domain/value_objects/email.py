@@ -4,7 +4,14 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import ClassVar, Self
+from typing import Self
+
+
+# RFC 5322 compliant regex (simplified but robust), compiled once at import
+# and bound to its match method so validation skips the attribute lookups.
+_match_email = re.compile(
+    r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
+).match
 
 
 @dataclass(frozen=True, slots=True)
@@ -15,11 +22,6 @@ class Email:
     and provides type safety for email operations.
     """
     
-    # RFC 5322 compliant regex (simplified but robust)
-    _EMAIL_REGEX: ClassVar[re.Pattern[str]] = re.compile(
-        r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
-    )
-    
     value: str
     
     
@@ -30,17 +32,19 @@ class Email:
         if not isinstance(self.value, str):
             raise TypeError("Email value must be a string")
         
-        if not self.value.strip():
+        # Normalize the email (lowercase and strip whitespace); values loaded
+        # from storage are already normalized, so the write is usually skipped
+        normalized = self.value.strip().lower()
+        if not normalized:
             raise ValueError("Email cannot be empty")
         
-        # Normalize the email (lowercase and strip whitespace)
-        normalized = self.value.strip().lower()
-        object.__setattr__(self, 'value', normalized)
+        if normalized != self.value:
+            object.__setattr__(self, 'value', normalized)
         
         if len(normalized) > 254:  # RFC 5321 limit
             raise ValueError("Email address is too long (max 254 characters)")
         
-        if not self._EMAIL_REGEX.match(normalized):
+        if not _match_email(normalized):
             raise ValueError(f"Invalid email format: {normalized}")
     
     
@@ -5,6 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Self
 
+# Translation table that deletes the separators allowed inside a name
+_NAME_SEPARATORS = str.maketrans('', '', " -'")
+
 
 @dataclass(frozen=True, slots=True)
 class LastName:
@@ -21,9 +24,11 @@ class LastName:
         if not isinstance(self.value, str):
             raise TypeError("Last name must be a string")
         
-        # Normalize the name (strip whitespace and title case)
+        # Normalize the name (strip whitespace and title case); values loaded
+        # from storage are already normalized, so the write is usually skipped
         normalized = self.value.strip().title()
-        object.__setattr__(self, 'value', normalized)
+        if normalized != self.value:
+            object.__setattr__(self, 'value', normalized)
         
         if not normalized:
             raise ValueError("Last name cannot be empty")
@@ -35,7 +40,8 @@ class LastName:
             raise ValueError("Last name cannot exceed 50 characters")
         
         # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        if not all(char.isalpha() or char in [' ', '-', "'"] for char in normalized):
+        letters = normalized.translate(_NAME_SEPARATORS)
+        if letters and not letters.isalpha():
             raise ValueError("Last name can only contain letters, spaces, hyphens, and apostrophes")
     
     @classmethod
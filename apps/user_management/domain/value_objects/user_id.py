@@ -4,16 +4,32 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Self
 
 
-@dataclass(frozen=True, slots=True)
+@lru_cache(maxsize=1024)
+def _parse_uuid(value: str) -> uuid.UUID:
+    """Parse a UUID string, memoizing recently seen identifiers.
+    
+    The same user id is parsed on every authenticated request, so the
+    most recent strings are cached. Invalid input is not cached since
+    lru_cache does not store raised exceptions.
+    """
+    return uuid.UUID(value)
+
+
+@dataclass(frozen=True)
 class UserId:
     """A unique identifier for a user.
     
     This value object wraps a UUID to provide type safety and domain meaning.
     """
     
+    # Declared by hand rather than with slots=True so the _str cache gets a
+    # slot without becoming a dataclass field (fields()/asdict() stay {value})
+    __slots__ = ('value', '_str')
+    
     value: uuid.UUID
     
     
@@ -53,7 +69,7 @@ class UserId:
             ValueError: If the string is not a valid UUID.
         """
         try:
-            return cls(uuid.UUID(value))
+            return cls(_parse_uuid(value))
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid UUID string: {value}") from e
     
@@ -62,11 +78,25 @@ class UserId:
     
     def __str__(self) -> str:
         """Return string representation of the UserId."""
-        return str(self.value)
+        # str(value) is cached lazily; ids are formatted repeatedly for
+        # DTOs, events and log lines
+        try:
+            return self._str
+        except AttributeError:
+            text = str(self.value)
+            object.__setattr__(self, '_str', text)
+            return text
     
     
     
     
     def __repr__(self) -> str:
         """Return detailed string representation."""
-        return f"UserId({self.value!r})"
\ No newline at end of file
+        return f"UserId({self.value!r})"
+    
+    
+    
+    
+    def __reduce__(self) -> tuple:
+        """Pickle/copy through the constructor; frozen slots can't be set directly."""
+        return (type(self), (self.value,))
\ No newline at end of file
@@ -37,6 +37,8 @@ class InfrastructurePasswordService:
     to provide the async interface expected by application handlers.
     """
     
+    __slots__ = ('_hasher', '_policy')
+    
     def __init__(
         self,
         password_hasher: DomainPasswordHasher,
@@ -90,6 +92,8 @@ class InfrastructureTokenService:
     This adapter provides async token operations using the domain TokenProvider.
     """
     
+    __slots__ = ('_provider',)
+    
     def __init__(self, token_provider: DomainTokenProvider) -> None:
         """Initialize the token service adapter.
         
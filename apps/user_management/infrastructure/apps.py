@@ -34,7 +34,7 @@ class UserManagementInfrastructureConfig(AppConfig):
         """
         # Import domain events and services
         from ..domain.events.user_events import UserRegistered
-        from ..application.event_bus import EventBus
+        from ..application.event_bus import event_bus
         from .subscribers.notify_on_user_events import (
             on_user_registered,
             on_user_password_changed,
@@ -42,9 +42,6 @@ class UserManagementInfrastructureConfig(AppConfig):
             on_user_deactivated,
         )
         
-        # Get the global event bus instance
-        event_bus = EventBus.get_instance()
-        
         # Register event handlers
         event_bus.subscribe(UserRegistered, on_user_registered)
         
@@ -4,7 +4,7 @@ This module provides a simple dependency injection container
 for managing infrastructure service instances and their dependencies.
 """
 
-from typing import Optional, Protocol, TypeVar
+from typing import Callable, Optional, Protocol, TypeVar
 
 from ..domain.repositories.user_repository import UserRepository
 from ..domain.services.password_policy import PasswordHasher, PasswordPolicy, TokenProvider
@@ -32,10 +32,37 @@ class ServiceProvider(Protocol):
 class InfrastructureContainer:
     """Simple dependency injection container for infrastructure services."""
     
+    __slots__ = ('_services', '_config', '_factories')
+    
     def __init__(self) -> None:
         """Initialize container with lazy service creation."""
         self._services: dict[type, object] = {}
         self._config = get_config()
+        
+        # Factories keyed by the type requested from get(); abstract and
+        # concrete types share a factory so both resolve the same way.
+        self._factories: dict[type, Callable[[], object]] = {
+            # Repository services
+            UserRepository: DjangoUserRepository,
+            DjangoUserRepository: DjangoUserRepository,
+            
+            # Auth services
+            PasswordHasher: self._create_password_hasher,
+            BcryptPasswordHasher: self._create_password_hasher,
+            TokenProvider: self._create_token_provider,
+            JWTTokenProvider: self._create_token_provider,
+            PasswordPolicy: self._create_password_policy,
+            DefaultPasswordPolicy: lambda: DefaultPasswordPolicy(
+                min_length=self._config.auth.password_min_length
+            ),
+            LenientPasswordPolicy: lambda: LenientPasswordPolicy(
+                min_length=self._config.auth.password_min_length
+            ),
+            StrictPasswordPolicy: StrictPasswordPolicy,
+            
+            # Transaction manager
+            DjangoTransactionManager: create_transaction_manager,
+        }
     
     def get(self, service_type: type[T]) -> T:
         """Get service instance by type.
@@ -49,12 +76,10 @@ class InfrastructureContainer:
         Raises:
             ValueError: If service type is not registered.
         """
-        if service_type in self._services:
-            return self._services[service_type]  # type: ignore
-        
-        # Create service instance based on type
-        service = self._create_service(service_type)
-        self._services[service_type] = service
+        service = self._services.get(service_type)
+        if service is None:
+            service = self._create_service(service_type)
+            self._services[service_type] = service
         return service  # type: ignore
     
     def register(self, service_type: type[T], instance: T) -> None:
@@ -78,64 +103,34 @@ class InfrastructureContainer:
         Raises:
             ValueError: If service type is not supported.
         """
-        # Repository services
-        if service_type == UserRepository:
-            return DjangoUserRepository()
-        
-        # Auth services
-        elif service_type == PasswordHasher:
-            return BcryptPasswordHasher(
-                rounds=self._config.auth.bcrypt_rounds
-            )
-        
-        elif service_type == TokenProvider:
-            return JWTTokenProvider(
-                secret_key=self._config.auth.jwt_secret_key,
-                algorithm=self._config.auth.jwt_algorithm,
-                expiry_minutes=self._config.auth.jwt_access_token_expire_minutes,
-            )
-        
-        elif service_type == PasswordPolicy:
-            policy_type = getattr(self._config.auth, 'password_policy_type', 'default')
-            if policy_type == 'lenient':
-                return LenientPasswordPolicy(min_length=self._config.auth.password_min_length)
-            elif policy_type == 'strict':
-                return StrictPasswordPolicy()
-            else:
-                return DefaultPasswordPolicy(min_length=self._config.auth.password_min_length)
-        
-        # Concrete implementation types
-        elif service_type == DjangoUserRepository:
-            return DjangoUserRepository()
-        
-        elif service_type == BcryptPasswordHasher:
-            return BcryptPasswordHasher(
-                rounds=self._config.auth.bcrypt_rounds
-            )
-        
-        elif service_type == JWTTokenProvider:
-            return JWTTokenProvider(
-                secret_key=self._config.auth.jwt_secret_key,
-                algorithm=self._config.auth.jwt_algorithm,
-                access_token_expire_minutes=self._config.auth.jwt_access_token_expire_minutes,
-                refresh_token_expire_days=self._config.auth.jwt_refresh_token_expire_days,
-            )
-        
-        elif service_type == DefaultPasswordPolicy:
-            return DefaultPasswordPolicy(min_length=self._config.auth.password_min_length)
-        
-        elif service_type == LenientPasswordPolicy:
+        factory = self._factories.get(service_type)
+        if factory is None:
+            raise ValueError(f"Unknown service type: {service_type}")
+        return factory()
+    
+    def _create_password_hasher(self) -> BcryptPasswordHasher:
+        """Create the bcrypt password hasher from configuration."""
+        return BcryptPasswordHasher(
+            rounds=self._config.auth.bcrypt_rounds
+        )
+    
+    def _create_token_provider(self) -> JWTTokenProvider:
+        """Create the JWT token provider from configuration."""
+        return JWTTokenProvider(
+            secret_key=self._config.auth.jwt_secret_key,
+            algorithm=self._config.auth.jwt_algorithm,
+            expiry_minutes=self._config.auth.jwt_access_token_expire_minutes,
+        )
+    
+    def _create_password_policy(self) -> PasswordPolicy:
+        """Create the password policy selected in configuration."""
+        policy_type = getattr(self._config.auth, 'password_policy_type', 'default')
+        if policy_type == 'lenient':
             return LenientPasswordPolicy(min_length=self._config.auth.password_min_length)
-        
-        elif service_type == StrictPasswordPolicy:
+        elif policy_type == 'strict':
             return StrictPasswordPolicy()
-        
-        # Transaction manager
-        elif service_type == DjangoTransactionManager:
-            return create_transaction_manager()
-        
         else:
-            raise ValueError(f"Unknown service type: {service_type}")
+            return DefaultPasswordPolicy(min_length=self._config.auth.password_min_length)
 
 
 # Global container instance
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user_management", "0002_alter_outboxevent_id_alter_usermodel_id"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="outboxevent",
+            name="outbox_processed_idx",
+        ),
+        migrations.AddIndex(
+            model_name="outboxevent",
+            index=models.Index(
+                fields=["processed_at", "created_at"], name="outbox_pending_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-16 10:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user_management", "0003_outboxevent_outbox_pending_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="usermodel",
+            name="user_status_idx",
+        ),
+        migrations.AddIndex(
+            model_name="usermodel",
+            index=models.Index(
+                fields=["status", "created_at"], name="user_status_created_idx"
+            ),
+        ),
+    ]
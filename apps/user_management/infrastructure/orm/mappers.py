@@ -83,8 +83,7 @@ def create_model_from_entity(entity: User) -> UserModel:
     Note:
         The returned model is not saved. Call save() explicitly.
     """
-    data = entity_to_model_data(entity)
-    return UserModel(**data)
+    return UserModel(**entity_to_model_data(entity))
 
 
 def update_model_from_entity(model: UserModel, entity: User) -> UserModel:
@@ -70,7 +70,8 @@ class UserModel(models.Model):
         verbose_name_plural = "Users"
         indexes = [
             models.Index(fields=['email'], name='user_email_idx'),
-            models.Index(fields=['status'], name='user_status_idx'),
+            # Serves status filters and the created_at-ordered active listing
+            models.Index(fields=['status', 'created_at'], name='user_status_created_idx'),
             models.Index(fields=['created_at'], name='user_created_idx'),
         ]
 
@@ -142,7 +143,9 @@ class OutboxEvent(models.Model):
         verbose_name_plural = "Outbox Events"
         indexes = [
             models.Index(fields=['event_type'], name='outbox_event_type_idx'),
-            models.Index(fields=['processed_at'], name='outbox_processed_idx'),
+            # Leading processed_at also serves plain processed/pending filters;
+            # created_at lets the dispatcher read pending rows in order.
+            models.Index(fields=['processed_at', 'created_at'], name='outbox_pending_idx'),
             models.Index(fields=['created_at'], name='outbox_created_idx'),
             models.Index(fields=['aggregate_id'], name='outbox_aggregate_idx'),
         ]
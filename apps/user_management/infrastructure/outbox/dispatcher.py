@@ -8,10 +8,11 @@ from __future__ import annotations
 
 import json
 import logging
+import uuid
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional, Protocol
 
-from django.db import models, transaction
+from django.db import models
 from django.utils import timezone
 
 from ..orm.models import OutboxEvent
@@ -61,8 +62,8 @@ class OutboxDispatcher:
         self._handlers: Dict[str, EventHandler] = {}
         
         logger.debug(
-            f"Initialized OutboxDispatcher: max_retries={max_retries}, "
-            f"retry_delay={retry_delay_minutes}min, batch_size={batch_size}"
+            "Initialized OutboxDispatcher: max_retries=%s, retry_delay=%smin, batch_size=%s",
+            max_retries, retry_delay_minutes, batch_size
         )
     
     def register_handler(self, event_type: str, handler: EventHandler) -> None:
@@ -73,7 +74,7 @@ class OutboxDispatcher:
             handler: Event handler instance.
         """
         self._handlers[event_type] = handler
-        logger.debug(f"Registered handler for event type: {event_type}")
+        logger.debug("Registered handler for event type: %s", event_type)
     
     def unregister_handler(self, event_type: str) -> None:
         """Unregister an event handler.
@@ -83,7 +84,7 @@ class OutboxDispatcher:
         """
         if event_type in self._handlers:
             del self._handlers[event_type]
-            logger.debug(f"Unregistered handler for event type: {event_type}")
+            logger.debug("Unregistered handler for event type: %s", event_type)
     
     async def flush_outbox(self) -> Dict[str, int]:
         """Process unprocessed outbox events.
@@ -110,7 +111,7 @@ class OutboxDispatcher:
                 logger.debug("No unprocessed events found")
                 return stats
             
-            logger.info(f"Processing {len(unprocessed_events)} outbox events")
+            logger.info("Processing %d outbox events", len(unprocessed_events))
             
             # Process events in batches
             for i in range(0, len(unprocessed_events), self._batch_size):
@@ -122,12 +123,12 @@ class OutboxDispatcher:
                     stats[key] += batch_stats[key]
             
             logger.info(
-                f"Outbox flush completed: processed={stats['processed']}, "
-                f"failed={stats['failed']}, skipped={stats['skipped']}"
+                "Outbox flush completed: processed=%d, failed=%d, skipped=%d",
+                stats['processed'], stats['failed'], stats['skipped']
             )
             
         except Exception as e:
-            logger.error(f"Outbox flush operation failed: {e}")
+            logger.error("Outbox flush operation failed: %s", e)
             raise
         
         return stats
@@ -152,13 +153,22 @@ class OutboxDispatcher:
                 attempts__lt=self._max_retries,
                 created_at__lt=retry_cutoff
             )
-        ).order_by('created_at')[:self._batch_size * 2]  # Get extra for buffering
+        ).order_by('created_at').only(
+            # Only the columns the dispatcher reads or writes back, plus
+            # aggregate_id for __repr__: a deferred field would trigger a
+            # synchronous fetch, which fails in async context
+            'id', 'event_type', 'aggregate_id', 'payload', 'attempts',
+            'processed_at', 'error_message'
+        )[:self._batch_size * 2]  # Get extra for buffering
         
-        return [event async for event in events]
+        return [event async for event in events.aiterator(chunk_size=self._batch_size)]
     
     async def _process_batch(self, events: List[OutboxEvent]) -> Dict[str, int]:
         """Process a batch of outbox events.
         
+        Successfully handled events are marked processed with a single
+        bulk UPDATE once the whole batch has been handled.
+        
         Args:
             events: Batch of events to process.
             
@@ -166,38 +176,49 @@ class OutboxDispatcher:
             Processing statistics for the batch.
         """
         stats = {'processed': 0, 'failed': 0, 'skipped': 0}
+        processed_ids: List[uuid.UUID] = []
         
         for event in events:
             try:
                 result = await self._process_event(event)
                 stats[result] += 1
+                if result == 'processed':
+                    processed_ids.append(event.id)
             except Exception as e:
-                logger.error(f"Error processing event {event.id}: {e}")
+                logger.error("Error processing event %s: %s", event.id, e)
                 stats['failed'] += 1
         
+        if processed_ids:
+            await OutboxEvent.objects.filter(id__in=processed_ids).aupdate(
+                processed_at=timezone.now()
+            )
+        
         return stats
     
     async def _process_event(self, event: OutboxEvent) -> str:
         """Process a single outbox event.
         
+        Failed attempts are recorded immediately; successful events are
+        left for the caller to mark processed in bulk.
+        
         Args:
             event: Outbox event to process.
             
         Returns:
             Processing result: 'processed', 'failed', or 'skipped'.
         """
-        logger.debug(f"Processing outbox event: {event.id} ({event.event_type})")
+        logger.debug("Processing outbox event: %s (%s)", event.id, event.event_type)
         
         # Check if we have a handler for this event type
         handler = self._handlers.get(event.event_type)
         if not handler:
-            logger.debug(f"No handler for event type: {event.event_type}")
+            logger.debug("No handler for event type: %s", event.event_type)
             return 'skipped'
         
         # Check if event has exceeded max retries
         if event.attempts >= self._max_retries:
             logger.warning(
-                f"Event {event.id} exceeded max retries ({self._max_retries})"
+                "Event %s exceeded max retries (%s)", event.id, self._max_retries
             )
             return 'skipped'
         
@@ -205,21 +226,15 @@ class OutboxDispatcher:
             # Process the event
             await handler.handle(event.event_type, event.payload)
             
-            # Mark as processed
-            async with transaction.atomic():
-                event.mark_processed()
-                event.save()
-            
-            logger.debug(f"Successfully processed event: {event.id}")
+            logger.debug("Successfully processed event: %s", event.id)
             return 'processed'
             
         except Exception as e:
-            logger.error(f"Failed to process event {event.id}: {e}")
+            logger.error("Failed to process event %s: %s", event.id, e)
             
             # Increment attempts and record error
-            async with transaction.atomic():
-                event.increment_attempts(str(e))
-                event.save()
+            event.increment_attempts(str(e))
+            await event.asave(update_fields=['attempts', 'error_message'])
             
             return 'failed'
     
@@ -247,7 +262,7 @@ class OutboxDispatcher:
             logger.debug("No failed events ready for retry")
             return {'processed': 0, 'failed': 0, 'skipped': 0}
         
-        logger.info(f"Retrying {len(events_list)} failed events")
+        logger.info("Retrying %d failed events", len(events_list))
         return await self._process_batch(events_list)
     
     async def cleanup_processed_events(self, older_than_days: int = 30) -> int:
@@ -259,7 +274,7 @@ class OutboxDispatcher:
         Returns:
             Number of events deleted.
         """
-        logger.info(f"Cleaning up processed events older than {older_than_days} days")
+        logger.info("Cleaning up processed events older than %s days", older_than_days)
         
         cutoff_date = timezone.now() - timedelta(days=older_than_days)
         
@@ -268,7 +283,7 @@ class OutboxDispatcher:
             processed_at__lt=cutoff_date
         ).adelete()
         
-        logger.info(f"Cleaned up {deleted_count} processed events")
+        logger.info("Cleaned up %s processed events", deleted_count)
         return deleted_count
     
     def get_statistics(self) -> Dict[str, Any]:
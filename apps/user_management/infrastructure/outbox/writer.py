@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
 from django.db import transaction
@@ -20,6 +21,55 @@ from ..orm.models import OutboxEvent
 logger = logging.getLogger(__name__)
 
 
+def _validate_payload(payload: Dict[str, Any]) -> None:
+    """Ensure an event payload can be stored in the JSON payload column.
+    
+    Only run for writes deferred with transaction.on_commit, where a
+    failure inside the callback would surface after the caller has moved
+    on. Immediate writes leave the encoding to JSONField, which raises
+    TypeError for an unserializable payload, so the payload is encoded
+    once.
+    
+    Args:
+        payload: Event data as dictionary.
+        
+    Raises:
+        ValueError: If the payload is not JSON serializable.
+    """
+    try:
+        json.dumps(payload)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Event payload is not JSON serializable: {e}") from e
+
+
+def _domain_event_fields(domain_event: Any) -> Tuple[str, Optional[UUID], Dict[str, Any]]:
+    """Extract the outbox columns from a domain event.
+    
+    Args:
+        domain_event: Domain event object with to_dict() method.
+        
+    Returns:
+        Tuple of (event_type, aggregate_id, payload).
+        
+    Raises:
+        ValueError: If domain event is invalid.
+    """
+    if not hasattr(domain_event, 'to_dict'):
+        raise ValueError("Domain event must have to_dict() method")
+    
+    event_type = domain_event.__class__.__name__
+    payload = domain_event.to_dict()
+    
+    # Extract aggregate ID if available
+    aggregate_id = None
+    if hasattr(domain_event, 'aggregate_id'):
+        aggregate_id = getattr(domain_event, 'aggregate_id')
+        if hasattr(aggregate_id, 'value'):
+            aggregate_id = aggregate_id.value
+    
+    return event_type, aggregate_id, payload
+
+
 def write_outbox_event(
     event_type: str,
     aggregate_id: Optional[UUID] = None,
@@ -39,6 +89,7 @@ def write_outbox_event(
         
     Raises:
         ValueError: If event data is invalid.
+        TypeError: If an immediately written payload is not JSON serializable.
     """
     if not event_type:
         raise ValueError("Event type cannot be empty")
@@ -46,44 +97,29 @@ def write_outbox_event(
     if payload is None:
         payload = {}
     
-    logger.debug(f"Writing outbox event: {event_type}, aggregate: {aggregate_id}")
-    
-    try:
-        # Validate payload can be serialized to JSON
-        json.dumps(payload)
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"Event payload is not JSON serializable: {e}") from e
+    logger.debug("Writing outbox event: %s, aggregate: %s", event_type, aggregate_id)
     
-    def _create_event() -> OutboxEvent:
-        """Internal function to create the outbox event."""
-        event = OutboxEvent(
-            event_type=event_type,
-            aggregate_id=aggregate_id,
-            payload=payload,
-            created_at=timezone.now(),
-            attempts=0
-        )
-        return event
+    event = OutboxEvent(
+        event_type=event_type,
+        aggregate_id=aggregate_id,
+        payload=payload,
+        created_at=timezone.now(),
+        attempts=0
+    )
     
     if use_transaction_commit:
         # Use transaction.on_commit to ensure event is only written
-        # after the main transaction commits successfully
-        def _save_on_commit():
-            event = _create_event()
-            event.save()
-            logger.debug(f"Outbox event saved on commit: {event.id}")
-        
-        transaction.on_commit(_save_on_commit)
-        
-        # Return a temporary event for immediate use (won't have ID)
-        temp_event = _create_event()
-        logger.debug(f"Outbox event scheduled for commit: {event_type}")
-        return temp_event
+        # after the main transaction commits successfully. The returned
+        # instance is the one that gets saved, so it is persisted with its
+        # ID once the transaction commits.
+        _validate_payload(payload)
+        transaction.on_commit(event.save)
+        logger.debug("Outbox event scheduled for commit: %s", event_type)
+        return event
     else:
         # Save immediately within current transaction
-        event = _create_event()
         event.save()
-        logger.debug(f"Outbox event saved immediately: {event.id}")
+        logger.debug("Outbox event saved immediately: %s", event.id)
         return event
 
 
@@ -107,15 +143,7 @@ def write_domain_event(
         raise ValueError("Domain event must have to_dict() method")
     
     try:
-        event_type = domain_event.__class__.__name__
-        payload = domain_event.to_dict()
-        
-        # Extract aggregate ID if available
-        aggregate_id = None
-        if hasattr(domain_event, 'aggregate_id'):
-            aggregate_id = getattr(domain_event, 'aggregate_id')
-            if hasattr(aggregate_id, 'value'):
-                aggregate_id = aggregate_id.value
+        event_type, aggregate_id, payload = _domain_event_fields(domain_event)
         
         return write_outbox_event(
             event_type=event_type,
@@ -125,7 +153,7 @@ def write_domain_event(
         )
         
     except Exception as e:
-        logger.error(f"Failed to write domain event to outbox: {e}")
+        logger.error("Failed to write domain event to outbox: %s", e)
         raise ValueError(f"Failed to write domain event: {e}") from e
 
 
@@ -135,6 +163,9 @@ def write_multiple_events(
 ) -> list[OutboxEvent]:
     """Write multiple domain events to the outbox.
     
+    All events are inserted with a single bulk INSERT (scheduled through
+    one transaction.on_commit callback when use_transaction_commit is set).
+    
     Args:
         events: List of domain event objects.
         use_transaction_commit: If True, uses transaction.on_commit for reliability.
@@ -144,21 +175,37 @@ def write_multiple_events(
         
     Raises:
         ValueError: If any event is invalid.
+        TypeError: If an immediately written payload is not JSON serializable.
     """
     if not events:
         return []
     
-    logger.debug(f"Writing {len(events)} events to outbox")
+    logger.debug("Writing %d events to outbox", len(events))
     
     outbox_events = []
-    for event in events:
-        outbox_event = write_domain_event(
-            event,
-            use_transaction_commit=use_transaction_commit
-        )
-        outbox_events.append(outbox_event)
+    try:
+        for event in events:
+            event_type, aggregate_id, payload = _domain_event_fields(event)
+            if use_transaction_commit:
+                _validate_payload(payload)
+            outbox_events.append(OutboxEvent(
+                event_type=event_type,
+                aggregate_id=aggregate_id,
+                payload=payload,
+                created_at=timezone.now(),
+                attempts=0
+            ))
+    except Exception as e:
+        logger.error("Failed to write domain events to outbox: %s", e)
+        raise ValueError(f"Failed to write domain events: {e}") from e
+    
+    if use_transaction_commit:
+        transaction.on_commit(partial(OutboxEvent.objects.bulk_create, outbox_events))
+        logger.debug("Scheduled %d outbox events for commit", len(outbox_events))
+    else:
+        OutboxEvent.objects.bulk_create(outbox_events)
+        logger.debug("Successfully wrote %d events to outbox", len(outbox_events))
     
-    logger.debug(f"Successfully wrote {len(outbox_events)} events to outbox")
     return outbox_events
 
 
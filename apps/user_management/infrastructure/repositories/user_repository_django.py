@@ -21,8 +21,6 @@ from ..orm.mappers import (
     create_model_from_entity,
     entity_to_model_data,
     model_to_entity,
-    update_model_from_entity,
-    validate_model_data,
 )
 from ..orm.models import UserModel
 
@@ -53,7 +51,6 @@ class DjangoUserRepository(UserRepository):
         
         try:
             model = UserModel.objects.get(id=user_id.value)
-            validate_model_data(model)
             user = model_to_entity(model)
             logger.debug(f"Found user: {user.id.value}")
             return user
@@ -158,14 +155,13 @@ class DjangoUserRepository(UserRepository):
         logger.debug(f"Saving new user: {user.email.value}")
         
         try:
-            # Check if user already exists
-            if self.exists_by_email(user.email):
-                raise UserAlreadyExistsError(f"User with email {user.email.value} already exists")
+            # Create new model; the unique email constraint rejects duplicates
+            # in the same round trip, so no separate existence query is made.
+            # The savepoint keeps an enclosing transaction usable on conflict.
+            model = create_model_from_entity(user)
             
-            # Create new model
-            model_data = entity_to_model_data(user)
-            
-            model = UserModel.objects.create(**model_data)
+            with transaction.atomic():
+                model.save(force_insert=True)
             logger.info(f"User saved with ID: {model.id}")
             
             # Convert back to entity and return
@@ -175,7 +171,7 @@ class DjangoUserRepository(UserRepository):
         except IntegrityError as e:
             logger.error(f"Database integrity error saving user: {e}")
             if "email" in str(e).lower():
-                raise UserAlreadyExistsError(f"User with email {user.email.value} already exists")
+                raise UserAlreadyExistsError(user.email.value) from e
             raise ValueError(f"Invalid user data: {e}")
         except Exception as e:
             logger.error(f"Error saving user {user.email.value}: {e}")
@@ -198,29 +194,28 @@ class DjangoUserRepository(UserRepository):
         logger.debug(f"Updating user: {user.id.value}")
         
         try:
-            # Get existing model
-            try:
-                existing_model = UserModel.objects.get(id=user.id.value)
-            except ObjectDoesNotExist:
-                logger.warning(f"User not found for update: {user.id.value}")
-                raise UserNotFoundError(str(user.id.value))
+            # Update the row in place with a single UPDATE; a zero row count
+            # means the user does not exist. QuerySet.update() bypasses
+            # auto_now, so the entity's own updated_at (stamped by the
+            # domain mutators) is what gets stored.
+            model_data = entity_to_model_data(user)
+            del model_data['id']
             
-            # Update model with new data
             try:
-                updated_model = update_model_from_entity(existing_model, user)
-                updated_model.save()
+                with transaction.atomic():
+                    updated_rows = UserModel.objects.filter(id=user.id.value).update(**model_data)
             except IntegrityError as e:
                 if 'email' in str(e).lower():
                     logger.warning(f"Email already exists during update: {user.email.value}")
                     raise UserAlreadyExistsError(user.email.value) from e
                 raise ValueError(f"Database integrity error: {e}") from e
             
-            # Return updated entity
-            validate_model_data(updated_model)
-            updated_user = model_to_entity(updated_model)
+            if not updated_rows:
+                logger.warning(f"User not found for update: {user.id.value}")
+                raise UserNotFoundError(str(user.id))
                 
             logger.info(f"Successfully updated user: {user.id.value}")
-            return updated_user
+            return user
             
         except (UserNotFoundError, UserAlreadyExistsError):
             raise
@@ -271,14 +266,17 @@ class DjangoUserRepository(UserRepository):
         """
         logger.debug(f"Finding active users (limit={limit}, offset={offset})")
         
+        if limit <= 0:
+            return []
+        
         try:
-            models = UserModel.objects.filter(status='active')[offset:offset + limit]
-            users = []
-            
-            for model in models:
-                validate_model_data(model)
-                user = model_to_entity(model)
-                users.append(user)
+            # model_to_entity builds (and so validates) every value object.
+            # Rows are streamed with iterator() so the queryset does not keep
+            # a second, cached copy of the page alongside the entities.
+            models = UserModel.objects.filter(
+                status='active'
+            ).order_by('created_at')[offset:offset + limit]
+            users = [model_to_entity(model) for model in models.iterator(chunk_size=min(limit, 2000))]
             
             logger.debug(f"Found {len(users)} active users")
             return users
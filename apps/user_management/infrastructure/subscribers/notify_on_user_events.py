@@ -15,7 +15,7 @@ from ..outbox.writer import write_domain_event
 logger = logging.getLogger(__name__)
 
 
-async def on_user_registered(event: UserRegistered) -> None:
+def on_user_registered(event: UserRegistered) -> None:
     """Handle UserRegistered domain event.
     
     Writes the event to the outbox for reliable delivery to external systems.
@@ -31,21 +31,21 @@ async def on_user_registered(event: UserRegistered) -> None:
     Raises:
         Exception: If outbox writing fails.
     """
-    logger.info(f"Handling UserRegistered event for user: {event.aggregate_id}")
+    logger.info("Handling UserRegistered event for user: %s", event.aggregate_id)
     
     try:
         # Write event to outbox for reliable delivery
-        await write_domain_event(event, use_transaction_commit=True)
+        write_domain_event(event, use_transaction_commit=True)
         
-        logger.debug(f"Successfully wrote UserRegistered event to outbox: {event.aggregate_id}")
+        logger.debug("Successfully wrote UserRegistered event to outbox: %s", event.aggregate_id)
         
     except Exception as e:
-        logger.error(f"Failed to write UserRegistered event to outbox: {e}")
+        logger.error("Failed to write UserRegistered event to outbox: %s", e)
         # Re-raise to ensure the error is visible to the event bus
         raise
 
 
-async def on_user_password_changed(event: Any) -> None:
+def on_user_password_changed(event: Any) -> None:
     """Handle UserPasswordChanged domain event.
     
     Writes the event to the outbox for security audit and notification purposes.
@@ -56,20 +56,20 @@ async def on_user_password_changed(event: Any) -> None:
     Raises:
         Exception: If outbox writing fails.
     """
-    logger.info(f"Handling UserPasswordChanged event for user: {event.aggregate_id}")
+    logger.info("Handling UserPasswordChanged event for user: %s", event.aggregate_id)
     
     try:
         # Write event to outbox for reliable delivery
-        await write_domain_event(event, use_transaction_commit=True)
+        write_domain_event(event, use_transaction_commit=True)
         
-        logger.debug(f"Successfully wrote UserPasswordChanged event to outbox: {event.aggregate_id}")
+        logger.debug("Successfully wrote UserPasswordChanged event to outbox: %s", event.aggregate_id)
         
     except Exception as e:
-        logger.error(f"Failed to write UserPasswordChanged event to outbox: {e}")
+        logger.error("Failed to write UserPasswordChanged event to outbox: %s", e)
         raise
 
 
-async def on_user_profile_updated(event: Any) -> None:
+def on_user_profile_updated(event: Any) -> None:
     """Handle UserProfileUpdated domain event.
     
     Writes the event to the outbox for profile change notifications and auditing.
@@ -80,20 +80,20 @@ async def on_user_profile_updated(event: Any) -> None:
     Raises:
         Exception: If outbox writing fails.
     """
-    logger.info(f"Handling UserProfileUpdated event for user: {event.aggregate_id}")
+    logger.info("Handling UserProfileUpdated event for user: %s", event.aggregate_id)
     
     try:
         # Write event to outbox for reliable delivery
-        await write_domain_event(event, use_transaction_commit=True)
+        write_domain_event(event, use_transaction_commit=True)
         
-        logger.debug(f"Successfully wrote UserProfileUpdated event to outbox: {event.aggregate_id}")
+        logger.debug("Successfully wrote UserProfileUpdated event to outbox: %s", event.aggregate_id)
         
     except Exception as e:
-        logger.error(f"Failed to write UserProfileUpdated event to outbox: {e}")
+        logger.error("Failed to write UserProfileUpdated event to outbox: %s", e)
         raise
 
 
-async def on_user_deactivated(event: Any) -> None:
+def on_user_deactivated(event: Any) -> None:
     """Handle UserDeactivated domain event.
     
     Writes the event to the outbox for account closure notifications and cleanup.
@@ -104,14 +104,14 @@ async def on_user_deactivated(event: Any) -> None:
     Raises:
         Exception: If outbox writing fails.
     """
-    logger.info(f"Handling UserDeactivated event for user: {event.aggregate_id}")
+    logger.info("Handling UserDeactivated event for user: %s", event.aggregate_id)
     
     try:
         # Write event to outbox for reliable delivery
-        await write_domain_event(event, use_transaction_commit=True)
+        write_domain_event(event, use_transaction_commit=True)
         
-        logger.debug(f"Successfully wrote UserDeactivated event to outbox: {event.aggregate_id}")
+        logger.debug("Successfully wrote UserDeactivated event to outbox: %s", event.aggregate_id)
         
     except Exception as e:
-        logger.error(f"Failed to write UserDeactivated event to outbox: {e}")
+        logger.error("Failed to write UserDeactivated event to outbox: %s", e)
         raise
\ No newline at end of file
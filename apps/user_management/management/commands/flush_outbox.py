@@ -12,7 +12,7 @@ from typing import Any, Dict
 
 from django.core.management.base import BaseCommand, CommandError
 
-from ...dispatcher import create_outbox_dispatcher
+from ...infrastructure.outbox.dispatcher import create_outbox_dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +49,19 @@ class Command(BaseCommand):
             help='Number of events to process in each batch (default: 50)'
         )
         
+        parser.add_argument(
+            '--continuous',
+            action='store_true',
+            help='Keep flushing the outbox until interrupted'
+        )
+        
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=30,
+            help='Seconds between flushes in continuous mode (default: 30)'
+        )
+        
         parser.add_argument(
             '--retry-failed',
             action='store_true',
@@ -114,9 +127,13 @@ class Command(BaseCommand):
                 asyncio.run(self._cleanup_events(dispatcher, options['cleanup_days']))
             elif options['retry_failed']:
                 asyncio.run(self._retry_failed_events(dispatcher))
+            elif options['continuous']:
+                asyncio.run(self._flush_continuously(dispatcher, options['interval']))
             else:
                 asyncio.run(self._flush_outbox(dispatcher))
             
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping outbox processing...")
         except Exception as e:
             logger.error(f"Command execution failed: {e}")
             raise CommandError(f"Failed to process outbox events: {e}") from e
@@ -147,6 +164,27 @@ class Command(BaseCommand):
             )
             raise
     
+    async def _flush_continuously(self, dispatcher, interval: int) -> None:
+        """Flush the outbox repeatedly until interrupted.
+        
+        All cycles share one event loop rather than starting a new loop
+        per flush.
+        
+        Args:
+            dispatcher: Outbox dispatcher instance.
+            interval: Seconds to wait between flushes.
+        """
+        self.stdout.write(f"Running continuously (interval: {interval}s), press Ctrl+C to stop")
+        
+        while True:
+            try:
+                await self._flush_outbox(dispatcher)
+            except Exception as e:
+                # Keep polling; the next cycle retries whatever is pending
+                logger.error("Outbox flush cycle failed: %s", e, exc_info=True)
+            
+            await asyncio.sleep(interval)
+    
     async def _retry_failed_events(self, dispatcher) -> None:
         """Retry previously failed events.
         
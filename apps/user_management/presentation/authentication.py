@@ -14,7 +14,7 @@ from django.http import HttpRequest
 from typing import Optional, Tuple, Any
 import logging
 
-from ..infrastructure.container import InfrastructureContainer
+from ..infrastructure.container import get_container
 from ..domain.entities import User
 from ..domain.errors import UserDeactivatedError, UserNotFoundError
 from ..domain.repositories.user_repository import UserRepository
@@ -77,7 +77,7 @@ class JWTAuthentication(BaseAuthentication):
     keyword = 'Bearer'
     
     def __init__(self):
-        self.container = InfrastructureContainer()
+        self.container = get_container()
         self.token_provider = self.container.get(TokenProvider)
         self.user_repository = self.container.get(UserRepository)
 
@@ -14,6 +14,7 @@ from rest_framework.response import Response
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.conf import settings
+from django.db import transaction
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 from django.http import JsonResponse
 import logging
@@ -46,8 +47,8 @@ from ..application.commands import (
     DeactivateUserCommand,
 )
 from ..application.dto import UserDTO, AuthResultDTO
-from ..infrastructure.container import InfrastructureContainer
-from ..infrastructure.outbox.writer import write_domain_event
+from ..infrastructure.container import get_container
+from ..infrastructure.outbox.writer import write_multiple_events
 from ..domain.repositories.user_repository import UserRepository
 from ..domain.services.password_policy import PasswordHasher, TokenProvider
 from ..domain.errors import (
@@ -78,18 +79,15 @@ def _publish_domain_events(events):
     """
     Publish domain events to the outbox for reliable delivery.
     
+    Must be called inside the transaction that persists the state change;
+    errors propagate so that a failed outbox write rolls back the change.
+    
     Args:
         events: List of domain events to publish
     """
-    try:
-        logger.info(f"Publishing {len(events)} domain events to outbox")
-        for event in events:
-            logger.debug(f"Publishing event: {event.__class__.__name__}")
-            write_domain_event(event, use_transaction_commit=False)
-        logger.info(f"Successfully published {len(events)} domain events to outbox")
-    except Exception as e:
-        logger.error(f"Failed to publish domain events: {str(e)}", exc_info=True)
-        # Don't raise - event publishing failure shouldn't break the main flow
+    logger.info("Publishing %d domain events to outbox", len(events))
+    write_multiple_events(events, use_transaction_commit=False)
+    logger.info("Successfully published %d domain events to outbox", len(events))
 
 
 def _handle_domain_errors(error: Exception) -> Response:
@@ -163,11 +161,11 @@ def _create_user_response_data(user_dto) -> Dict[str, Any]:
         Dictionary with user data for response
     """
     return {
-        "id": str(user_dto.id),
+        "id": user_dto.id,
         "email": user_dto.email,
         "first_name": user_dto.first_name,
         "last_name": user_dto.last_name,
-        "full_name": f"{user_dto.first_name} {user_dto.last_name}",
+        "full_name": user_dto.full_name,
         "status": user_dto.status,
         "created_at": user_dto.created_at.isoformat() if user_dto.created_at else None,
         "updated_at": user_dto.updated_at.isoformat() if user_dto.updated_at else None,
@@ -223,19 +221,21 @@ def register_user(request: Request) -> Response:
         )
         
         # Execute use case
-        container = InfrastructureContainer()
+        container = get_container()
         handler = RegisterUserHandler(
             user_repository=container.get(UserRepository),
             password_service=container.get(PasswordHasher),
         )
         
-        user_result = handler.handle(register_command)
+        # Persist the user and its outbox events in a single transaction
+        with transaction.atomic():
+            user_result = handler.handle(register_command)
+            
+            # Publish domain events to outbox
+            if hasattr(user_result, 'events') and user_result.events:
+                _publish_domain_events(user_result.events)
         user_dto = user_result.user_dto
         
-        # Publish domain events to outbox
-        if hasattr(user_result, 'events') and user_result.events:
-            _publish_domain_events(user_result.events)
-        
         # Return response
         user_data = _create_user_response_data(user_dto)
         return Response(user_data, status=status.HTTP_201_CREATED)
@@ -297,7 +297,7 @@ def authenticate_user(request: Request) -> Response:
         )
         
         # Execute use case
-        container = InfrastructureContainer()
+        container = get_container()
         handler = AuthenticateUserHandler(
             user_repository=container.get(UserRepository),
             password_service=container.get(PasswordHasher),
@@ -363,16 +363,7 @@ def get_current_user(request: Request) -> Response:
             )
         
         # Create user response data
-        user_data = _create_user_response_data(UserDTO(
-            id=str(current_user.id.value),
-            email=current_user.email.value,
-            first_name=current_user.first_name.value,
-            last_name=current_user.last_name.value,
-            full_name=f"{current_user.first_name.value} {current_user.last_name.value}",
-            status=current_user.status.value,
-            created_at=current_user.created_at,
-            updated_at=current_user.updated_at
-        ))
+        user_data = _create_user_response_data(UserDTO.from_entity(current_user))
         
         return Response(user_data, status=status.HTTP_200_OK)
         
@@ -437,23 +428,25 @@ def update_profile(request: Request) -> Response:
         
         # Create command
         update_command = UpdateProfileCommand(
-            user_id=str(current_user.id.value),  # Convert UserId to string
+            user_id=str(current_user.id),  # Convert UserId to string
             new_email=serializer.validated_data.get('email'),
             new_first_name=serializer.validated_data.get('first_name'),
             new_last_name=serializer.validated_data.get('last_name'),
         )
         
         # Execute use case using proper handler
-        container = InfrastructureContainer()
+        container = get_container()
         handler = UpdateProfileHandler(
             user_repository=container.get(UserRepository),
         )
         
-        update_result = handler.handle(update_command)
-        
-        # Publish domain events to outbox
-        if hasattr(update_result, 'events') and update_result.events:
-            _publish_domain_events(update_result.events)
+        # Persist the update and its outbox events in a single transaction
+        with transaction.atomic():
+            update_result = handler.handle(update_command)
+            
+            # Publish domain events to outbox
+            if hasattr(update_result, 'events') and update_result.events:
+                _publish_domain_events(update_result.events)
         
         # Return response
         user_data = _create_user_response_data(update_result.user_dto)
@@ -517,23 +510,25 @@ def change_password(request: Request) -> Response:
         
         # Create command
         change_password_command = ChangePasswordCommand(
-            user_id=str(current_user.id.value),  # Convert UserId to string
+            user_id=str(current_user.id),  # Convert UserId to string
             old_password=serializer.validated_data['old_password'],
             new_password=serializer.validated_data['new_password'],
         )
         
         # Execute use case
-        container = InfrastructureContainer()
+        container = get_container()
         handler = ChangePasswordHandler(
             user_repository=container.get(UserRepository),
             password_service=container.get(PasswordHasher),
         )
         
-        change_result = handler.handle(change_password_command)
-        
-        # Publish domain events to outbox
-        if hasattr(change_result, 'events') and change_result.events:
-            _publish_domain_events(change_result.events)
+        # Persist the change and its outbox events in a single transaction
+        with transaction.atomic():
+            change_result = handler.handle(change_password_command)
+            
+            # Publish domain events to outbox
+            if hasattr(change_result, 'events') and change_result.events:
+                _publish_domain_events(change_result.events)
         
         # Return success response
         return Response(
@@ -599,20 +594,22 @@ def deactivate_user(request: Request) -> Response:
         
         # Create command
         deactivate_command = DeactivateUserCommand(
-            user_id=str(current_user.id.value),  # Convert UserId to string
+            user_id=str(current_user.id),  # Convert UserId to string
             reason=serializer.validated_data.get('reason'),
         )
         
         # Execute use case
-        container = InfrastructureContainer()
+        container = get_container()
         handler = DeactivateUserHandler(
             user_repository=container.get(UserRepository),
         )
         
-        deactivate_result = handler.handle(deactivate_command)
-        
-        # Publish domain events
-        _publish_domain_events(deactivate_result.events)
+        # Persist the deactivation and its outbox events in a single transaction
+        with transaction.atomic():
+            deactivate_result = handler.handle(deactivate_command)
+            
+            # Publish domain events
+            _publish_domain_events(deactivate_result.events)
         
         # Return success response
         return Response(
@@ -635,7 +632,7 @@ def deactivate_user(request: Request) -> Response:
 def user_health_check(request: Request) -> Response:
     """Simple health check for user management API."""
     try:
-        container = InfrastructureContainer()
+        container = get_container()
         # Simple test to verify container works
         user_repo = container.get(UserRepository)
         
@@ -1,3 +1,39 @@
-from django.test import TestCase
+import uuid
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from .application.event_bus import EventBus
+from .domain.events.user_events import UserDeactivated
+from .domain.value_objects.email import Email
+from .domain.value_objects.user_id import UserId
+
+
+class EventBusPublishAllTests(SimpleTestCase):
+    """Delivery order of EventBus.publish_all."""
+
+    def _deactivated(self, reason):
+        return UserDeactivated(
+            aggregate_id=UserId(uuid.uuid4()),
+            email=Email("user@example.com"),
+            reason=reason,
+        )
+
+    def test_run_of_same_typed_events_is_delivered_handler_major(self):
+        bus = EventBus()
+        calls = []
+
+        def h1(event):
+            calls.append(("h1", event.reason))
+
+        def h2(event):
+            calls.append(("h2", event.reason))
+
+        bus.subscribe(UserDeactivated, h1)
+        bus.subscribe(UserDeactivated, h2)
+
+        bus.publish_all([self._deactivated("e1"), self._deactivated("e2")])
+
+        self.assertEqual(
+            calls,
+            [("h1", "e1"), ("h1", "e2"), ("h2", "e1"), ("h2", "e2")],
+        )
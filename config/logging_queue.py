@@ -0,0 +1,76 @@
+"""
+Queued logging configuration for the Expense Tracker project.
+
+Installed through the LOGGING_CONFIG setting. The LOGGING dict is applied
+as usual, then the handlers attached to each configured logger are moved
+behind a QueueHandler and served by a background QueueListener, so the
+console/file I/O happens off the request thread. The record is still
+formatted (message and any traceback) in the calling thread by
+QueueHandler.prepare(); only the handler I/O moves.
+"""
+
+import atexit
+import logging
+import logging.config
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class ForkSafeQueueHandler(QueueHandler):
+    """QueueHandler that owns its QueueListener and restarts it after fork.
+
+    A forked child (e.g. a gunicorn worker started with --preload)
+    inherits the handler but not the listener thread, so records queued
+    there would never be written. The child gets a fresh queue and
+    listener right after fork.
+    """
+
+    def __init__(self, handlers):
+        super().__init__(queue.SimpleQueue())
+        self._handlers = handlers
+        self._listener = None
+        self._start_listener()
+        os.register_at_fork(after_in_child=self._restart_listener)
+        atexit.register(self._stop_listener)
+
+    def _start_listener(self):
+        self._listener = QueueListener(self.queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+
+    def _restart_listener(self):
+        # The parent's listener thread does not exist in the child
+        self.queue = queue.SimpleQueue()
+        self._start_listener()
+
+    def _stop_listener(self):
+        # Flushes the records still queued in this process
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+
+def configure_logging(logging_settings):
+    """Apply the LOGGING dict and route its handlers through a queue.
+
+    Loggers sharing the same set of handlers share one queue and one
+    listener thread. Listeners are stopped at interpreter exit so queued
+    records are flushed.
+    """
+    logging.config.dictConfig(logging_settings)
+
+    loggers = [logging.getLogger()]
+    loggers += [logging.getLogger(name) for name in logging_settings.get('loggers', {})]
+
+    queue_handlers = {}
+    for logger in loggers:
+        if not logger.handlers:
+            continue
+
+        handlers = tuple(logger.handlers)
+        queue_handler = queue_handlers.get(handlers)
+        if queue_handler is None:
+            queue_handler = ForkSafeQueueHandler(handlers)
+            queue_handlers[handlers] = queue_handler
+
+        logger.handlers = [queue_handler]
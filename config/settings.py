@@ -264,7 +264,11 @@ SPECTACULAR_SETTINGS = {
 
 
 # Logging Configuration
-# Enhanced logging for development and debugging
+# Enhanced logging for development and debugging.
+# Handlers run on a background QueueListener so request threads don't
+# block on console/file I/O.
+
+LOGGING_CONFIG = 'config.logging_queue.configure_logging'
 
 LOGGING = {
     'version': 1,